@@ -1,4 +1,5 @@
 use std::borrow::Cow;
+use std::io::Write;
 
 use anyhow::{Context, Result};
 use ostree_container::OstreeImageReference;
@@ -58,13 +59,10 @@ impl DeploymentStatus {
     pub(crate) fn from_deployment(deployment: &ostree::Deployment, booted: bool) -> Result<Self> {
         let staged = deployment.is_staged();
         let pinned = deployment.is_pinned();
-        let image = get_image_origin(deployment)?.1;
+        let (origin, image) = get_image_origin(deployment)?;
         let checksum = deployment.csum().unwrap().to_string();
         let deploy_serial = (!staged).then(|| deployment.bootserial().try_into().unwrap());
-        let supported = deployment
-            .origin()
-            .map(|o| !crate::utils::origin_has_rpmostree_stuff(&o))
-            .unwrap_or_default();
+        let supported = !crate::utils::origin_has_rpmostree_stuff(&origin);
 
         Ok(DeploymentStatus {
             staged,
@@ -78,21 +76,19 @@ impl DeploymentStatus {
     }
 }
 
-/// Gather the ostree deployment objects, but also extract metadata from them into
-/// a more native Rust structure.
+/// Extract metadata from the ostree deployments into a more native Rust structure.
 fn get_deployments(
     sysroot: &SysrootLock,
     booted_deployment: &ostree::Deployment,
     booted: bool,
-) -> Result<Vec<(ostree::Deployment, DeploymentStatus)>> {
+) -> Result<Vec<DeploymentStatus>> {
     sysroot
         .deployments()
         .into_iter()
         .filter(|deployment| !booted || deployment.equal(booted_deployment))
-        .map(|deployment| -> Result<_> {
+        .map(|deployment| {
             let booted = deployment.equal(booted_deployment);
-            let status = DeploymentStatus::from_deployment(&deployment, booted)?;
-            Ok((deployment, status))
+            DeploymentStatus::from_deployment(&deployment, booted)
         })
         .collect()
 }
@@ -104,19 +100,19 @@ pub(crate) async fn status(opts: super::cli::StatusOpts) -> Result<()> {
     let booted_deployment = &sysroot.require_booted_deployment()?;
 
     let deployments = get_deployments(&sysroot, booted_deployment, opts.booted)?;
-    // If we're in JSON mode, then convert the ostree data into Rust-native
-    // structures that can be serialized.
+    // In JSON mode, serialize the status structures directly to stdout.
     if opts.json {
-        // Filter to just the serializable status structures.
-        let deployments = deployments.into_iter().map(|e| e.1).collect::<Vec<_>>();
+        // stdout's LineWriter has a small buffer; use a larger BufWriter to
+        // reduce write(2) calls for large JSON.
         let out = std::io::stdout();
-        let mut out = out.lock();
+        let mut out = std::io::BufWriter::new(out.lock());
         serde_json::to_writer(&mut out, &deployments).context("Writing to stdout")?;
+        out.flush().context("Flushing stdout")?;
         return Ok(());
     }
 
     // We're not writing to JSON; iterate over and print.
-    for (deployment, info) in deployments {
+    for info in deployments {
         let booted_display = info.booted.then(|| "* ").unwrap_or(" ");
         let image: Option<OstreeImageReference> = info.image.as_ref().map(|i| i.clone().into());
 
@@ -148,12 +144,12 @@ pub(crate) async fn status(opts: super::cli::StatusOpts) -> Result<()> {
             println!();
         }
         println!("    Backend: ostree");
-        if deployment.is_pinned() {
+        if info.pinned {
             println!("    Pinned: yes")
         }
         if info.booted {
             println!("    Booted: yes")
-        } else if deployment.is_staged() {
+        } else if info.staged {
             println!("    Staged: yes");
         }
         println!();